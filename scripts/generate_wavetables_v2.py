@@ -2,250 +2,334 @@
 """
 DSynth Advanced Wavetable Generator v2.0
 Generates 20 high-quality wavetables with complex spectral content
+
+Usage (from the repository root):
+    python3 scripts/generate_wavetables_v2.py          # regenerate if stale
+    python3 scripts/generate_wavetables_v2.py --force  # always regenerate
+
+A content hash of this script and its configuration is written to
+assets/wavetables/.stamp after a successful run. The stamp is committed
+with the generated WAVs, so a checkout whose assets match the script
+skips regeneration; --force bypasses the check.
 """
 
 import numpy as np
-from scipy.signal import butter, filtfilt
+from scipy.io import wavfile
+import hashlib
 import os
+import sys
 
 # Configuration
 OUTPUT_DIR = "assets/wavetables"
 SAMPLES_PER_CYCLE = 2048
 SAMPLE_RATE = 44100
+SEED = 42  # Base seed for the randomized tables (Fractal, Breath)
+STAMP_PATH = os.path.join(OUTPUT_DIR, ".stamp")
+
+# Shared single-cycle phase ramp and its radian form. Everything downstream
+# works in float32, the format the WAVs are written in; the tables below are
+# evaluated in float64 once and rounded, so they stay accurate to the last bit
+PHASE = np.linspace(0, 1, SAMPLES_PER_CYCLE, endpoint=False, dtype=np.float32)
+TWO_PI_PHASE = (2 * np.pi * PHASE.astype(np.float64)).astype(np.float32)
+
+# sin(2*pi*h*phase) for h = 1..MAX_HARMONIC; row h-1 holds harmonic h, so any
+# zero-phase integer-harmonic sum is amps @ HARM[:len(amps)]
+MAX_HARMONIC = 128
+HARM = np.sin(np.arange(1, MAX_HARMONIC + 1)[:, None]
+              * (2 * np.pi * PHASE.astype(np.float64))).astype(np.float32)
+
+# Highest harmonic kept in the band-limited classic shapes; N/4 leaves two
+# octaves of headroom below Nyquist before the table itself would alias
+BL_HARMONICS = SAMPLES_PER_CYCLE // 4
+
+def normalize(samples):
+    """Scale samples to ±1.0 in place (the epsilon keeps silence safe)"""
+    samples *= 1.0 / (np.max(np.abs(samples)) + 1e-12)
+    return samples
 
 def save_wavetable(filename, samples):
-    """Save normalized wavetable as 32-bit float WAV"""
-    # Normalize to ±1.0
-    samples = samples / (np.max(np.abs(samples)) + 1e-10)
-    
-    # Convert to 32-bit float WAV
-    import wave
-    import struct
-    
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    """Save a normalized float32 wavetable as 32-bit float WAV"""
     filepath = os.path.join(OUTPUT_DIR, f"{filename}.wav")
     
-    with wave.open(filepath, 'w') as wav:
-        wav.setnchannels(1)  # Mono
-        wav.setsampwidth(4)   # 32-bit = 4 bytes
-        wav.setframerate(SAMPLE_RATE)
-        wav.setnframes(len(samples))
-        wav.setcomptype('NONE', 'not compressed')
-        
-        # Write as 32-bit float
-        for sample in samples:
-            wav.writeframes(struct.pack('<f', sample))
+    # Write as mono 32-bit IEEE float WAV in a single call
+    wavfile.write(filepath, SAMPLE_RATE, samples)
     
     print(f"✓ Generated: {filename}.wav ({len(samples)} samples)")
 
+def additive(spectrum):
+    """Render integer-harmonic partials with a single inverse FFT
+    
+    spectrum[h] is the complex amplitude of harmonic h (spectrum[0] is unused);
+    an entry amp*exp(1j*theta) becomes amp * sin(2*pi*h*phase + theta).
+    """
+    X = np.zeros(SAMPLES_PER_CYCLE // 2 + 1, dtype=np.complex64)
+    X[1:len(spectrum)] = -0.5j * SAMPLES_PER_CYCLE * np.asarray(spectrum)[1:]
+    # irfft only keeps single precision on NumPy >= 2.0, so cast explicitly
+    return np.fft.irfft(X, SAMPLES_PER_CYCLE).astype(np.float32, copy=False)
+
+def harmonic_sum(amps, first=1):
+    """Sum amps[i] * sin(2*pi*(first + i)*phase) as one GEMV over the HARM table"""
+    amps = np.asarray(amps, dtype=np.float32)
+    return amps @ HARM[first - 1:first - 1 + len(amps)]
+
+def inharmonic(freqs, amps, offsets=None, phase=PHASE):
+    """Sum arbitrary-ratio partials with one 2-D sin and one matrix-vector product
+    
+    offsets are optional per-partial phase offsets in radians; phase defaults
+    to the shared PHASE ramp and is only overridden for phase distortion.
+    """
+    # Scale the K frequencies by 2*pi rather than the K x N grid, then keep
+    # every later step in place on that one buffer
+    arg = np.multiply.outer((2 * np.pi * np.asarray(freqs)).astype(np.float32), phase)
+    if offsets is not None:
+        arg += np.asarray(offsets, dtype=np.float32)[:, None]
+    np.sin(arg, out=arg)
+    return np.asarray(amps, dtype=np.float32) @ arg
+
+def save_bank(wavetables, bank):
+    """Write each bank row to its own WAV (build.rs embeds assets/wavetables/*.wav)"""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    for (name, _), samples in zip(wavetables, bank):
+        save_wavetable(name, samples)
+
 # ============================================================================
-# CLASSIC WAVETABLES (10) - unchanged
+# CLASSIC WAVETABLES (10) - band-limited geometric shapes
 # ============================================================================
 
-def generate_classic():
-    """Generate 10 classic waveforms"""
-    phase = np.linspace(0, 1, SAMPLES_PER_CYCLE, endpoint=False)
-    
-    # 1. Pure Sine
-    sine = np.sin(2 * np.pi * phase)
-    save_wavetable("01_Pure_Sine", sine)
+def sigma(h):
+    """Lanczos sigma factors for harmonics h of a series cut at BL_HARMONICS
     
-    # 2. Sawtooth
-    saw = 2 * phase - 1
-    save_wavetable("02_Sawtooth", saw)
-    
-    # 3. Square
-    square = np.where(phase < 0.5, 1.0, -1.0)
-    save_wavetable("03_Square", square)
-    
-    # 4. Triangle
-    triangle = np.where(phase < 0.5, 4*phase - 1, -4*phase + 3)
-    save_wavetable("04_Triangle", triangle)
-    
-    # 5. Pulse 25%
-    pulse25 = np.where(phase < 0.25, 1.0, -1.0)
-    save_wavetable("05_PWM_25", pulse25)
-    
-    # 6. Pulse 12.5%
-    pulse12 = np.where(phase < 0.125, 1.0, -1.0)
-    save_wavetable("06_PWM_12", pulse12)
-    
-    # 7. PPG Classic (limited harmonics, digital sound)
-    ppg = np.zeros(SAMPLES_PER_CYCLE)
-    for h in range(1, 9):
-        ppg += (1.0 / h) * np.sin(2 * np.pi * h * phase)
-    save_wavetable("07_PPG_Classic", ppg)
-    
-    # 8. Hollow (missing fundamental)
-    hollow = (0.8*np.sin(4*np.pi*phase) + 
-              0.6*np.sin(6*np.pi*phase) + 
-              0.4*np.sin(8*np.pi*phase))
-    save_wavetable("08_Hollow", hollow)
-    
-    # 9. Vocal Formant (human voice-like)
-    formant = (np.sin(2*np.pi*phase) + 
-               1.2*np.sin(6*np.pi*phase) + 
-               0.8*np.sin(8*np.pi*phase) +
-               0.4*np.sin(10*np.pi*phase))
-    save_wavetable("09_Vocal_Formant", formant)
-    
-    # 10. Bass Guitar (fundamental + odd harmonics)
-    bass = (np.sin(2*np.pi*phase) + 
-            0.4*np.sin(4*np.pi*phase) +
-            0.2*np.sin(6*np.pi*phase) +
-            0.1*np.sin(8*np.pi*phase))
-    save_wavetable("10_Bass_Guitar", bass)
+    A truncated series overshoots a jump by ~9% of its height (Gibbs), and
+    normalize() would then scale the flat parts down to fit that peak. Sigma
+    smoothing brings the overshoot near 1% so the plateaus stay near ±1.
+    """
+    return np.sinc(h / (BL_HARMONICS + 1))
+
+def saw_spectrum():
+    """Sigma-smoothed Fourier series of the rising saw 2*phase - 1, up to BL_HARMONICS"""
+    h = np.arange(1, BL_HARMONICS + 1)
+    spectrum = np.zeros(BL_HARMONICS + 1, dtype=np.complex64)
+    spectrum[h] = -2 / (np.pi * h) * sigma(h)
+    return spectrum
+
+def band_limited_pulse(duty):
+    """Pulse that is +1 for phase < duty, built as the difference of two saws"""
+    h = np.arange(BL_HARMONICS + 1)
+    # pulse(phase) = (2*duty - 1) - saw(phase) + saw(phase - duty)
+    spectrum = -saw_spectrum() * (1 - np.exp(-2j * np.pi * h * duty))
+    return additive(spectrum) + (2 * duty - 1)
+
+def make_sine():
+    """1. Pure Sine"""
+    # Copy: normalize() works in place and HARM is shared
+    return HARM[0].copy()
+
+def make_saw():
+    """2. Sawtooth"""
+    return additive(saw_spectrum())
+
+def make_square():
+    """3. Square (odd harmonics at 4/(pi*h), sigma-smoothed)"""
+    h = np.arange(1, BL_HARMONICS + 1, 2)
+    spectrum = np.zeros(BL_HARMONICS + 1, dtype=np.complex64)
+    spectrum[h] = 4 / (np.pi * h) * sigma(h)
+    return additive(spectrum)
+
+def make_triangle():
+    """4. Triangle (odd cosine harmonics at -8/(pi*h)^2, starting at -1)"""
+    h = np.arange(1, BL_HARMONICS + 1, 2)
+    spectrum = np.zeros(BL_HARMONICS + 1, dtype=np.complex64)
+    spectrum[h] = -8j / (np.pi * h) ** 2
+    return additive(spectrum)
+
+def make_pulse25():
+    """5. Pulse 25%"""
+    return band_limited_pulse(0.25)
+
+def make_pulse12():
+    """6. Pulse 12.5%"""
+    return band_limited_pulse(0.125)
+
+def make_ppg():
+    """7. PPG Classic (limited harmonics, digital sound)"""
+    return harmonic_sum(1.0 / np.arange(1, 9))
+
+def make_hollow():
+    """8. Hollow (missing fundamental)"""
+    return harmonic_sum([0.8, 0.6, 0.4], first=2)
+
+def make_formant():
+    """9. Vocal Formant (human voice-like)"""
+    return harmonic_sum([1.0, 0.0, 1.2, 0.8, 0.4])
+
+def make_bass():
+    """10. Bass Guitar (fundamental + odd harmonics)"""
+    return harmonic_sum([1.0, 0.4, 0.2, 0.1])
+
+CLASSIC_WAVETABLES = [
+    ("01_Pure_Sine", make_sine),
+    ("02_Sawtooth", make_saw),
+    ("03_Square", make_square),
+    ("04_Triangle", make_triangle),
+    ("05_PWM_25", make_pulse25),
+    ("06_PWM_12", make_pulse12),
+    ("07_PPG_Classic", make_ppg),
+    ("08_Hollow", make_hollow),
+    ("09_Vocal_Formant", make_formant),
+    ("10_Bass_Guitar", make_bass),
+]
 
 # ============================================================================
 # ADVANCED UNIQUE WAVETABLES (10) - NEW VERSION
 # ============================================================================
 
-def generate_unique():
-    """Generate 10 COMPLEX wavetables with STATIC rich harmonic spectra"""
-    phase = np.linspace(0, 1, SAMPLES_PER_CYCLE, endpoint=False)
-    
-    # 11. DIGITAL GLITCH - Extreme quantization + bit reduction
-    print("\nGenerating complex waveforms...")
+def make_glitch():
+    """11. DIGITAL GLITCH - Extreme quantization + bit reduction"""
     # Start with harmonically rich waveform
-    glitch = np.zeros(SAMPLES_PER_CYCLE)
-    for h in range(1, 25):
-        glitch += (1.0 / h) * np.sin(2 * np.pi * h * phase)
+    glitch = harmonic_sum(1.0 / np.arange(1, 25))
     # Apply severe quantization (6-bit)
-    glitch = np.round(glitch * 32) / 32
+    glitch *= 32
+    np.round(glitch, out=glitch)
+    glitch /= 32
     # Add phase distortion for extra harshness
-    phase_dist = phase + 0.3 * np.sin(2 * np.pi * phase)
-    for h in [3, 7, 11]:
-        glitch += 0.2 * np.sin(2 * np.pi * h * phase_dist)
-    save_wavetable("11_Stairs", glitch)
-    
-    # 12. HARMONIC CHAOS - Many inharmonic partials with random phases
-    np.random.seed(42)
-    fractal = np.zeros(SAMPLES_PER_CYCLE)
+    phase_dist = 0.3 * HARM[0]
+    phase_dist += PHASE
+    glitch += inharmonic([3, 7, 11], [0.2, 0.2, 0.2], phase=phase_dist)
+    return glitch
+
+def make_fractal(seed):
+    """12. HARMONIC CHAOS - Many inharmonic partials with random phases"""
+    # Private generator keeps the table independent of global NumPy random state
+    rng = np.random.default_rng(seed)
     # 64 partials with chaotic frequency relationships
-    for h in range(1, 65):
-        # Mix harmonic and slightly detuned partials
-        freq = h * (1.0 + np.random.uniform(-0.02, 0.02))
-        amp = 1.0 / np.sqrt(h)  # Pink noise spectrum
-        phase_rand = np.random.uniform(0, 2*np.pi)
-        fractal += amp * np.sin(2 * np.pi * freq * phase + phase_rand)
+    h = np.arange(1, 65)
+    # Mix harmonic and slightly detuned partials
+    freqs = h * (1.0 + rng.uniform(-0.02, 0.02, len(h)))
+    amps = 1.0 / np.sqrt(h)  # Pink noise spectrum
+    offsets = rng.uniform(0, 2*np.pi, len(h))
     # Add some strong inharmonic peaks
-    for ratio in [2.3, 3.7, 5.9, 8.1]:
-        fractal += 0.4 * np.sin(2 * np.pi * ratio * phase)
-    save_wavetable("12_Fractal", fractal)
-    
-    # 13. METALLIC - Bell-like inharmonic series (no temporal decay, just spectrum)
-    crystal = np.zeros(SAMPLES_PER_CYCLE)
+    peaks = [2.3, 3.7, 5.9, 8.1]
+    return inharmonic(np.concatenate([freqs, peaks]),
+                      np.concatenate([amps, np.full(len(peaks), 0.4)]),
+                      np.concatenate([offsets, np.zeros(len(peaks))]))
+
+def make_crystal():
+    """13. METALLIC - Bell-like inharmonic series (no temporal decay, just spectrum)"""
     # True bell inharmonic ratios - these create metallic timbre
     bell_ratios = [1.0, 2.756, 5.404, 8.933, 13.344, 18.64, 24.81, 31.87, 
                    39.86, 48.77, 58.65, 69.48, 81.27]
-    for i, ratio in enumerate(bell_ratios):
-        amp = 0.7 ** i  # Amplitude decay
-        # Add slight detuning for chorus effect
-        for detune in [-0.003, 0.0, 0.003]:
-            crystal += (amp / 3) * np.sin(2 * np.pi * (ratio + detune) * phase)
+    # Add slight detuning for chorus effect, with amplitude decay per ratio
+    freqs = [ratio + detune for ratio in bell_ratios for detune in (-0.003, 0.0, 0.003)]
+    amps = [(0.7 ** i) / 3 for i in range(len(bell_ratios)) for _ in range(3)]
     # Add dense high-frequency content
-    for h in range(40, 80):
-        crystal += (0.1 / h) * np.sin(2 * np.pi * h * 1.414 * phase)
-    save_wavetable("13_Crystal", crystal)
-    
-    # 14. SUB DESTROYER - Thick detuned sub-bass with upper harmonics
-    earthquake = np.zeros(SAMPLES_PER_CYCLE)
-    # Multiple detuned fundamentals create thick beating bass
-    for detune in [-0.05, -0.025, -0.01, 0.0, 0.01, 0.025, 0.05]:
-        earthquake += np.sin(2 * np.pi * (1.0 + detune) * phase)
-        # Add octave below for extra weight
-        earthquake += 0.5 * np.sin(2 * np.pi * (0.5 + detune * 0.5) * phase)
+    h = np.arange(40, 80)
+    return inharmonic(np.concatenate([freqs, h * 1.414]),
+                      np.concatenate([amps, 0.1 / h]))
+
+def make_earthquake():
+    """14. SUB DESTROYER - Thick detuned sub-bass with upper harmonics"""
+    # Multiple detuned fundamentals create thick beating bass,
+    # each with an octave below for extra weight
+    detunes = np.array([-0.05, -0.025, -0.01, 0.0, 0.01, 0.025, 0.05])
+    earthquake = inharmonic(np.concatenate([1.0 + detunes, 0.5 + detunes * 0.5]),
+                            np.repeat([1.0, 0.5], len(detunes)))
     # Add some mid-range harmonics for definition
-    for h in [3, 5, 7]:
-        earthquake += (0.3 / h) * np.sin(2 * np.pi * h * phase)
+    earthquake += harmonic_sum([0.3 / 3, 0.0, 0.3 / 5, 0.0, 0.3 / 7], first=3)
     # Slight waveshaping for more harmonics
-    earthquake = np.tanh(earthquake * 0.8)
-    save_wavetable("14_Earthquake", earthquake)
-    
-    # 15. FM MADNESS - Extreme frequency modulation
-    # Deep FM creates very complex sidebands
-    carrier_freq = 1.0
-    modulator_freq = 3.7  # Non-integer ratio
-    mod_index = 12.0  # Very deep modulation
-    laser = np.sin(2 * np.pi * carrier_freq * phase + 
-                   mod_index * np.sin(2 * np.pi * modulator_freq * phase))
-    # Add second FM layer with different ratio
-    laser += 0.5 * np.sin(2 * np.pi * 2 * phase + 
-                          8.0 * np.sin(2 * np.pi * 5.3 * phase))
+    earthquake *= 0.8
+    return np.tanh(earthquake, out=earthquake)
+
+def make_laser():
+    """15. FM MADNESS - Extreme frequency modulation"""
+    # Deep FM creates very complex sidebands. Row 0 is the main layer, row 1 a
+    # second layer with a different ratio; each row is
+    # sin(2*pi*carrier*phase + mod_index * sin(2*pi*modulator*phase))
+    carrier_freq = np.array([1.0, 2.0], dtype=np.float32)[:, None]
+    modulator_freq = np.array([3.7, 5.3], dtype=np.float32)[:, None]  # Non-integer ratios
+    mod_index = np.array([12.0, 8.0], dtype=np.float32)[:, None]  # Very deep modulation
+    layer_gain = np.array([1.0, 0.5], dtype=np.float32)
+    # Both layers are evaluated in place in a single (2, N) buffer
+    fm = np.multiply(modulator_freq, TWO_PI_PHASE)
+    np.sin(fm, out=fm)
+    fm *= mod_index
+    fm += carrier_freq * TWO_PI_PHASE
+    np.sin(fm, out=fm)
+    laser = layer_gain @ fm
     # Hard waveshaping for even more harmonics
-    laser = np.tanh(laser * 3.0)
+    laser *= 3.0
+    np.tanh(laser, out=laser)
     # Add some pure inharmonic peaks
-    for ratio in [7.1, 11.3, 17.9]:
-        laser += 0.2 * np.sin(2 * np.pi * ratio * phase)
-    save_wavetable("15_Laser", laser)
-    
-    # 16. FORMANT STACK - Multiple vowel formants superimposed
+    laser += inharmonic([7.1, 11.3, 17.9], [0.2, 0.2, 0.2])
+    return laser
+
+def make_vowel():
+    """16. FORMANT STACK - Multiple vowel formants superimposed"""
     # Instead of morphing, stack all vowel resonances at once
-    vowel = np.zeros(SAMPLES_PER_CYCLE)
-    # "EE" formants (F1=270Hz, F2=2300Hz)
-    vowel += 0.8 * np.sin(2*np.pi*phase)
-    vowel += 1.2 * np.sin(2*np.pi*17*phase)
-    vowel += 0.6 * np.sin(2*np.pi*22*phase)
-    # "AH" formants (F1=730Hz, F2=1090Hz)
-    vowel += 1.5 * np.sin(2*np.pi*5.5*phase)
-    vowel += 1.0 * np.sin(2*np.pi*8*phase)
-    # "OO" formants (F1=300Hz, F2=870Hz)
-    vowel += 0.7 * np.sin(2*np.pi*2.2*phase)
-    vowel += 0.5 * np.sin(2*np.pi*6.5*phase)
+    # "EE" formants (F1=270Hz, F2=2300Hz) and "AH" F2 sit on integer harmonics
+    vowel_amps = np.zeros(64, dtype=np.float32)
+    vowel_amps[[0, 16, 21, 7]] = [0.8, 1.2, 0.6, 1.0]
     # Add many upper harmonics for breathiness
-    for h in range(25, 65):
-        vowel += (0.15 / h) * np.sin(2*np.pi*h*phase)
-    save_wavetable("16_Vowel_Morph", vowel)
-    
-    # 17. ALIASER - Intentional aliasing + extreme bit crushing
+    h = np.arange(25, 65)
+    vowel_amps[h - 1] = 0.15 / h
+    vowel = harmonic_sum(vowel_amps)
+    # "AH" F1 (730Hz) and "OO" formants (F1=300Hz, F2=870Hz)
+    vowel += inharmonic([5.5, 2.2, 6.5], [1.5, 0.7, 0.5])
+    return vowel
+
+def make_binary():
+    """17. ALIASER - Intentional aliasing + extreme bit crushing"""
     # Create a harmonically rich signal
-    binary = np.zeros(SAMPLES_PER_CYCLE)
-    for h in range(1, 33):
-        binary += (1.0 / h) * np.sin(2 * np.pi * h * phase)
+    binary = harmonic_sum(1.0 / np.arange(1, 33))
     # Severe sample-and-hold (8× reduction)
     downsample = 8
-    for i in range(0, SAMPLES_PER_CYCLE, downsample):
-        binary[i:min(i+downsample, SAMPLES_PER_CYCLE)] = binary[i]
+    binary = np.repeat(binary[::downsample], downsample)[:SAMPLES_PER_CYCLE]
+    assert len(binary) == SAMPLES_PER_CYCLE
     # 3-bit quantization (8 levels)
-    binary = np.round(binary * 4) / 4
+    binary *= 4
+    np.round(binary, out=binary)
+    binary /= 4
     # Add some high-frequency aliasing
-    for h in [37, 43, 51, 59]:
-        binary += 0.15 * np.sin(2 * np.pi * h * phase)
-    save_wavetable("17_Binary", binary)
-    
-    # 18. RING MOD CHAOS - Multiple ring modulation layers
+    binary += 0.15 * HARM[[36, 42, 50, 58]].sum(axis=0)
+    return binary
+
+def make_alien():
+    """18. RING MOD CHAOS - Multiple ring modulation layers"""
     # Ring mod creates sum and difference frequencies
-    carrier1 = np.sin(2 * np.pi * 1.0 * phase)
-    carrier2 = np.sin(2 * np.pi * 1.618 * phase)  # Golden ratio
-    carrier3 = np.sin(2 * np.pi * 2.718 * phase)  # e
-    # Three-way ring modulation
-    alien = carrier1 * carrier2 * carrier3
-    # Add sidebands from each pair
-    alien += 0.6 * (carrier1 * carrier2)
-    alien += 0.6 * (carrier2 * carrier3)
-    alien += 0.6 * (carrier1 * carrier3)
+    carrier1 = HARM[0]
+    # Golden ratio and e, evaluated as one in-place 2-D sin
+    carriers = np.multiply.outer(np.array([1.618, 2.718], dtype=np.float32), TWO_PI_PHASE)
+    carrier2, carrier3 = np.sin(carriers, out=carriers)
+    # Three-way ring modulation plus sidebands from each pair:
+    # c1*c2*c3 + 0.6*(c1*c2 + c2*c3 + c1*c3) == c1*c2*(c3 + 0.6) + 0.6*c3*(c1 + c2)
+    alien = carrier1 * carrier2
+    alien *= carrier3 + 0.6
+    sidebands = carrier1 + carrier2
+    sidebands *= 0.6 * carrier3
+    alien += sidebands
     # Add prime number harmonics
-    for prime in [3, 5, 7, 11, 13, 17, 19, 23, 29]:
-        alien += (0.3 / prime) * np.sin(2 * np.pi * prime * 1.414 * phase)
-    # Waveshaping for extra complexity
-    alien = np.sign(alien) * np.power(np.abs(alien), 0.7)
-    save_wavetable("18_Alien", alien)
-    
-    # 19. NOISE CLOUD - Structured noise (not filtered, pure spectral)
-    np.random.seed(45)
-    breath = np.zeros(SAMPLES_PER_CYCLE)
-    # Pink noise spectrum (many random-phase sine components)
-    for h in range(1, 129):  # Dense spectrum
-        amp = 1.0 / np.sqrt(h)  # Pink decay
-        phase_rand = np.random.uniform(0, 2*np.pi)
-        breath += amp * np.sin(2 * np.pi * h * phase + phase_rand)
+    primes = np.array([3, 5, 7, 11, 13, 17, 19, 23, 29])
+    alien += inharmonic(primes * 1.414, 0.3 / primes)
+    # Waveshaping for extra complexity (sign-preserving power curve)
+    shaped = np.abs(alien)
+    np.power(shaped, 0.7, out=shaped)
+    return np.copysign(shaped, alien, out=shaped)
+
+def make_breath(seed):
+    """19. NOISE CLOUD - Structured noise (not filtered, pure spectral)"""
+    # Private generator keeps the table independent of global NumPy random state;
+    # offset from the base seed so it does not share Fractal's stream
+    rng = np.random.default_rng(seed + 3)
+    # Pink noise spectrum (many random-phase sine components), built directly
+    # in the frequency domain so the cycle is exactly periodic
+    h = np.arange(1, 129)  # Dense spectrum, low-passed above harmonic 128
+    breath_spec = np.zeros(len(h) + 1, dtype=np.complex64)
+    breath_spec[h] = (1.0 / np.sqrt(h)) * np.exp(1j * rng.uniform(0, 2*np.pi, len(h)))  # Pink decay
     # Add some resonant peaks in the spectrum
-    for peak in [8, 15, 23, 35, 48]:
-        breath += 0.5 * np.sin(2 * np.pi * peak * phase)
-    save_wavetable("19_Breath", breath)
-    
-    # 20. RESONATOR BANK - Multiple resonant peaks (like physical resonance)
-    resonator = np.zeros(SAMPLES_PER_CYCLE)
+    breath_spec[[8, 15, 23, 35, 48]] += 0.5
+    return additive(breath_spec)
+
+def make_resonator():
+    """20. RESONATOR BANK - Multiple resonant peaks (like physical resonance)"""
     # Create resonant peaks at specific frequencies (like formants but more)
     resonances = [
         (1.0, 1.5),   # Fundamental with high Q
@@ -257,34 +341,95 @@ def generate_unique():
         (26.7, 0.3),  # Sixth resonance
         (35.8, 0.2),  # Seventh resonance
     ]
-    for freq, amp in resonances:
-        # Each resonance is a sine wave
-        resonator += amp * np.sin(2 * np.pi * freq * phase)
-        # Add slight detuning for width
-        resonator += amp * 0.3 * np.sin(2 * np.pi * (freq + 0.07) * phase)
-        resonator += amp * 0.3 * np.sin(2 * np.pi * (freq - 0.07) * phase)
+    # Each resonance is a sine wave plus two slightly detuned copies for width
+    freqs = [f + d for f, _ in resonances for d in (0.0, 0.07, -0.07)]
+    amps = [a * w for _, a in resonances for w in (1.0, 0.3, 0.3)]
+    resonator = inharmonic(freqs, amps)
     # Add dense high-frequency content
-    for h in range(40, 100):
-        resonator += (0.1 / h) * np.sin(2 * np.pi * h * phase)
-    save_wavetable("20_Harmonic_Decay", resonator)
+    resonator += harmonic_sum(0.1 / np.arange(40, 100), first=40)
+    return resonator
+
+UNIQUE_WAVETABLES = [
+    ("11_Stairs", make_glitch),
+    ("12_Fractal", make_fractal),
+    ("13_Crystal", make_crystal),
+    ("14_Earthquake", make_earthquake),
+    ("15_Laser", make_laser),
+    ("16_Vowel_Morph", make_vowel),
+    ("17_Binary", make_binary),
+    ("18_Alien", make_alien),
+    ("19_Breath", make_breath),
+    ("20_Harmonic_Decay", make_resonator),
+]
+
+WAVETABLES = CLASSIC_WAVETABLES + UNIQUE_WAVETABLES
+
+# Generators whose output depends on the random seed; they take it as their
+# only argument, every other generator takes none
+SEEDED_GENERATORS = {make_fractal, make_breath}
+
+def build_bank(wavetables=WAVETABLES, seed=SEED):
+    """Render (name, generator) pairs into one normalized float32 bank
+    
+    Generators read the shared PHASE ramp and the tables derived from it
+    (TWO_PI_PHASE, HARM), so every row uses one phase; seed is passed to the
+    randomized ones. Row i of the returned (len(wavetables), SAMPLES_PER_CYCLE)
+    array holds wavetable i. Each table is only 2048 samples, so rendering runs
+    serially: the whole bank takes ~1 ms, less than a thread pool's startup cost.
+    """
+    bank = np.empty((len(wavetables), SAMPLES_PER_CYCLE), dtype=np.float32)
+    for row, (_, make) in zip(bank, wavetables):
+        samples = make(seed) if make in SEEDED_GENERATORS else make()
+        row[:] = normalize(samples)
+    return bank
+
+def bank_key():
+    """Content hash of everything that determines the output (source + config)"""
+    with open(__file__, "rb") as f:
+        source = f.read()
+    config = f"{SAMPLES_PER_CYCLE},{SAMPLE_RATE},{SEED}".encode()
+    return hashlib.sha256(source + config).hexdigest()
+
+def bank_is_current(key):
+    """True if the stamp matches key and every wavetable file is still present"""
+    try:
+        with open(STAMP_PATH) as f:
+            stamp = f.read().strip()
+    except OSError:
+        return False
+    return stamp == key and all(
+        os.path.exists(os.path.join(OUTPUT_DIR, f"{name}.wav")) for name, _ in WAVETABLES
+    )
 
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 
 if __name__ == "__main__":
+    key = bank_key()
+    if "--force" not in sys.argv[1:] and bank_is_current(key):
+        print(f"✅ Wavetables in {OUTPUT_DIR}/ are up to date (pass --force to regenerate)")
+        sys.exit(0)
+    
     print("\n" + "="*60)
     print("  DSynth Advanced Wavetable Generator v2.0")
     print("  Generating 20 wavetables (2048 samples @ 44.1kHz)")
     print("="*60 + "\n")
     
+    bank = build_bank()
+    n_classic = len(CLASSIC_WAVETABLES)
+    
     print("📦 Classic Wavetables (10):")
     print("-" * 60)
-    generate_classic()
+    save_bank(CLASSIC_WAVETABLES, bank[:n_classic])
     
     print("\n✨ Advanced Unique Wavetables (10):")
     print("-" * 60)
-    generate_unique()
+    save_bank(UNIQUE_WAVETABLES, bank[n_classic:])
+    
+    # Stamp last so an interrupted run regenerates next time
+    with open(STAMP_PATH, "w") as f:
+        f.write(key + "\n")
     
     print("\n" + "="*60)
     print(f"✅ Complete! 20 wavetables saved to: {OUTPUT_DIR}/")